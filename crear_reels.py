@@ -1,10 +1,14 @@
 from moviepy.editor import ImageClip, CompositeVideoClip, ColorClip, AudioFileClip
 from moviepy.video.fx.all import fadein, fadeout
+from moviepy.config import get_setting
 import sys
 import os
+import subprocess
+import tempfile
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 import argparse
+from yuv420 import YUV420Converter
 
 """
 Ejemplo de comando con todas las posibilidades de configuración:
@@ -18,6 +22,7 @@ Ejemplo de comando con todas las posibilidades de configuración:
     --image-effect fade
     --image-duration 5
     --text-duration 4
+    --pipe-format yuv420p
     --output corewave_reel.mp4
 
 Descripción de los parámetros:
@@ -31,6 +36,7 @@ Descripción de los parámetros:
 - --image-effect: Efecto para las imágenes (none, fade).
 - --image-duration: Duración de cada imagen en segundos (ejemplo: 5).
 - --text-duration: Duración de cada frase de texto en segundos (ejemplo: 4).
+- --pipe-format: Formato de los frames enviados a ffmpeg (rgb24, yuv420p). yuv420p envía la mitad de bytes por frame.
 - --output: Nombre del archivo de salida (ejemplo: corewave_reel.mp4).
 """
 
@@ -242,6 +248,58 @@ def parse_rgba(color_str):
         print(f"Error al parsear color RGBA: {e}. Usando color por defecto.")
         return (0, 51, 102, 128)  # Azul oscuro translúcido por defecto
 
+# Función para exportar el video enviando frames YUV420 directamente al stdin de ffmpeg
+def write_videofile_yuv420(clip, output_path, fps=24, codec="libx264", audio_codec="aac"):
+    width, height = clip.size
+    converter = YUV420Converter(width, height)
+
+    audio_path = None
+    if clip.audio is not None:
+        audio_path = os.path.splitext(output_path)[0] + "_TEMP_audio.m4a"
+        clip.audio.write_audiofile(audio_path, fps=44100, codec=audio_codec)
+
+    cmd = [
+        get_setting("FFMPEG_BINARY"), "-y", "-loglevel", "error",
+        "-f", "rawvideo", "-vcodec", "rawvideo",
+        "-s", f"{width}x{height}", "-pix_fmt", "yuv420p", "-r", str(fps),
+        "-i", "-",
+    ]
+    if audio_path:
+        cmd += ["-i", audio_path, "-acodec", "copy"]
+    cmd += ["-vcodec", codec, "-pix_fmt", "yuv420p", output_path]
+
+    # stderr va a un archivo temporal (como el logfile de moviepy) para que ffmpeg
+    # nunca se bloquee escribiendo en un pipe que nadie lee
+    log_file = tempfile.TemporaryFile()
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=log_file)
+    success = False
+    try:
+        try:
+            for frame in clip.iter_frames(fps=fps, dtype="uint8", logger="bar"):
+                # memoryview evita copiar el buffer antes de escribirlo en el pipe
+                proc.stdin.write(memoryview(converter.convert(frame)))
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass  # ffmpeg se cerró antes de tiempo, el error se reporta abajo
+        if proc.wait() != 0:
+            log_file.seek(0)
+            error = log_file.read().decode(errors="replace")
+            raise IOError(f"ffmpeg no pudo generar {output_path}: {error}")
+        success = True
+    finally:
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        log_file.close()
+        if not success and os.path.exists(output_path):
+            os.remove(output_path)  # No dejar un video truncado
+        if audio_path and os.path.exists(audio_path):
+            os.remove(audio_path)
+
 # Configuración de argumentos
 parser = argparse.ArgumentParser(description="Generar Reel con imágenes, texto y música")
 parser.add_argument("images", nargs='*', help="Rutas a las imágenes para el video")
@@ -255,6 +313,7 @@ parser.add_argument("--text-style", choices=["regular", "bold", "italic", "boldi
 parser.add_argument("--text-size", type=int, default=50, help="Tamaño de la fuente en píxeles (ejemplo: 40)")
 parser.add_argument("--image-duration", type=float, default=4.0, help="Duración de cada imagen en segundos (ejemplo: 5.0)")
 parser.add_argument("--text-duration", type=float, default=3.5, help="Duración de cada frase de texto en segundos (ejemplo: 4.0)")
+parser.add_argument("--pipe-format", choices=["rgb24", "yuv420p"], default="rgb24", help="Formato de los frames enviados a ffmpeg (rgb24, yuv420p)")
 args = parser.parse_args()
 
 # Ajustar el nombre del archivo de la fuente según el estilo
@@ -397,7 +456,10 @@ else:
 # Exportar video
 output_path = args.output
 try:
-    final_clip.write_videofile(output_path, fps=24, codec="libx264", audio_codec="aac")
+    if args.pipe_format == "yuv420p":
+        write_videofile_yuv420(final_clip, output_path, fps=24, codec="libx264", audio_codec="aac")
+    else:
+        final_clip.write_videofile(output_path, fps=24, codec="libx264", audio_codec="aac")
 except Exception as e:
     print(f"Error al generar el video: {e}")
 finally:
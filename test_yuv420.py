@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from yuv420 import YUV420Converter
+
+# Valores BT.601 de rango limitado (Y, U, V) para colores puros
+@pytest.mark.parametrize("rgb, yuv", [
+    ((0, 0, 0), (16, 128, 128)),
+    ((255, 255, 255), (235, 128, 128)),
+    ((255, 0, 0), (81, 90, 240)),
+    ((0, 255, 0), (145, 54, 34)),
+    ((0, 0, 255), (41, 240, 110)),
+])
+def test_colores_puros(rgb, yuv):
+    converter = YUV420Converter(4, 2)
+    frame = np.empty((2, 4, 3), dtype=np.uint8)
+    frame[:, :] = rgb
+    buffer = converter.convert(frame)
+
+    assert buffer.shape == (4 * 2 * 3 // 2,)
+    for plane, expected in zip((converter.y_plane, converter.u_plane, converter.v_plane), yuv):
+        assert np.abs(plane.astype(int) - expected).max() <= 1
+
+
+def test_frame_aleatorio_contra_referencia():
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, (6, 8, 4), dtype=np.uint8)
+    converter = YUV420Converter(8, 6)
+    converter.convert(frame)
+
+    r, g, b = (frame[:, :, i].astype(float) for i in range(3))
+    y = 16 + (65.481 * r + 128.553 * g + 24.966 * b) / 255
+    u = 128 + (-37.797 * r - 74.203 * g + 112.0 * b) / 255
+    v = 128 + (112.0 * r - 93.786 * g - 18.214 * b) / 255
+    u = u.reshape(3, 2, 4, 2).mean(axis=(1, 3))
+    v = v.reshape(3, 2, 4, 2).mean(axis=(1, 3))
+
+    assert np.abs(converter.y_plane - y).max() <= 1
+    assert np.abs(converter.u_plane - u).max() <= 1
+    assert np.abs(converter.v_plane - v).max() <= 1
+
+
+@pytest.mark.parametrize("width, height", [(1081, 1920), (1080, 1919)])
+def test_tamano_impar(width, height):
+    with pytest.raises(ValueError):
+        YUV420Converter(width, height)
@@ -0,0 +1,70 @@
+import numpy as np
+
+# Conversión de frames RGB a YUV420 planar (BT.601 de rango limitado, equivalente
+# salvo redondeo a la conversión por defecto de ffmpeg de rgb24 a yuv420p)
+
+# Clase para convertir frames RGB a YUV420 planar reutilizando siempre los mismos buffers
+class YUV420Converter:
+    def __init__(self, width, height):
+        if width % 2 or height % 2:
+            raise ValueError(f"El tamaño del video debe ser par para yuv420p: {width}x{height}")
+        self.width = width
+        self.height = height
+        luma_size = width * height
+        chroma_size = luma_size // 4
+        # Buffer de salida: plano Y, luego U y luego V, listo para escribir en el pipe
+        self.buffer = np.empty(luma_size + 2 * chroma_size, dtype=np.uint8)
+        self.y_plane = self.buffer[:luma_size].reshape(height, width)
+        self.u_plane = self.buffer[luma_size:luma_size + chroma_size].reshape(height // 2, width // 2)
+        self.v_plane = self.buffer[luma_size + chroma_size:].reshape(height // 2, width // 2)
+        # Buffers intermedios en uint16: alcanzan para todas las sumas sin desbordar
+        self.luma = np.empty((height, width), dtype=np.uint16)
+        self.luma_tmp = np.empty((height, width), dtype=np.uint16)
+        self.row_sum = np.empty((height // 2, width, 3), dtype=np.uint16)
+        self.rgb_avg = np.empty((3, height // 2, width // 2), dtype=np.uint16)
+        self.chroma = np.empty((height // 2, width // 2), dtype=np.uint16)
+        self.chroma_tmp = np.empty((height // 2, width // 2), dtype=np.uint16)
+
+    def convert(self, frame):
+        r, g, b = frame[:, :, 0], frame[:, :, 1], frame[:, :, 2]
+
+        # Luma a resolución completa: Y = ((66R + 129G + 25B + 128) >> 8) + 16
+        y = self.luma
+        np.multiply(r, 66, out=y, dtype=np.uint16)
+        np.multiply(g, 129, out=self.luma_tmp, dtype=np.uint16)
+        y += self.luma_tmp
+        np.multiply(b, 25, out=self.luma_tmp, dtype=np.uint16)
+        y += self.luma_tmp
+        y += 128 + (16 << 8)
+        y >>= 8
+        np.copyto(self.y_plane, y, casting="unsafe")
+
+        # Croma submuestreado: promedio redondeado de cada bloque 2x2, sumando
+        # primero pares de filas (contiguas) y después pares de columnas por canal
+        rgb = frame[:, :, :3]
+        np.add(rgb[0::2], rgb[1::2], out=self.row_sum, dtype=np.uint16)
+        avg = self.rgb_avg
+        for channel in range(3):
+            np.add(self.row_sum[:, 0::2, channel], self.row_sum[:, 1::2, channel], out=avg[channel])
+        avg += 2
+        avg >>= 2
+        r, g, b = avg
+
+        # U = ((-38R - 74G + 112B + 128) >> 8) + 128, con el desplazamiento sumado
+        # antes de restar para no salir del rango de uint16
+        self._chroma(self.u_plane, b, 112, r, 38, g, 74)
+        # V = ((112R - 94G - 18B + 128) >> 8) + 128
+        self._chroma(self.v_plane, r, 112, g, 94, b, 18)
+
+        return self.buffer
+
+    def _chroma(self, plane, pos, pos_coef, neg1, neg1_coef, neg2, neg2_coef):
+        c = self.chroma
+        np.multiply(pos, pos_coef, out=c)
+        c += 128 + (128 << 8)
+        np.multiply(neg1, neg1_coef, out=self.chroma_tmp)
+        c -= self.chroma_tmp
+        np.multiply(neg2, neg2_coef, out=self.chroma_tmp)
+        c -= self.chroma_tmp
+        c >>= 8
+        np.copyto(plane, c, casting="unsafe")